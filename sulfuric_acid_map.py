@@ -1,8 +1,37 @@
 import pandas as pd
 import re
+import functools
 import os
+import importlib.util
+import pathlib
 import webbrowser
+import gzip
+import base64
 import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use the faster native readers when they are installed; None keeps the pandas default.
+# pandas only knows the calamine engine from 2.2 on.
+_PANDAS_VERSION = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else None
+_EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') and _PANDAS_VERSION >= (2, 2) else None
+
+# Compiled once at import. The separator between the latitude and longitude
+# halves accepts both "37° 18' 3" N, 77° 16' 14" W" and "40°50'55"N 84°04'51"W".
+# Unlike the earlier per-format patterns, the latitude direction must be N or S
+# and the longitude direction E or W (mixed-up directions are rejected), and the
+# separator may be any run of commas and whitespace, so "N , 77°" is accepted.
+_COORD_RE = re.compile(
+    r'(?P<latd>\d+)[°º]\s*(?P<latm>\d+)[\'′]\s*(?P<lats>\d+(?:\.\d+)?)[\"″]?\s*(?P<latdir>[NS])'
+    r'[,\s]+'
+    r'(?P<lond>\d+)[°º]\s*(?P<lonm>\d+)[\'′]\s*(?P<lons>\d+(?:\.\d+)?)[\"″]?\s*(?P<londir>[EW])',
+    re.IGNORECASE
+)
 
 def parse_coordinates(coord_str):
     """Convert DMS coordinates to decimal degrees."""
@@ -11,69 +40,29 @@ def parse_coordinates(coord_str):
     
     try:
         # Clean up the coordinate string
-        cleaned_str = str(coord_str).strip()
-        
-        # Define regex patterns for different coordinate formats
-        patterns = [
-            # "37° 18' 3" N, 77° 16' 14" W"
-            r'(\d+)[°º]\s*(\d+)[\'′]\s*(\d+(?:\.\d+)?)[\"″]?\s*([NSEW]),\s*(\d+)[°º]\s*(\d+)[\'′]\s*(\d+(?:\.\d+)?)[\"″]?\s*([NSEW])',
-            # "40°50'55"N 84°04'51"W"
-            r'(\d+)[°º]\s*(\d+)[\'′]\s*(\d+(?:\.\d+)?)[\"″]?\s*([NSEW])\s+(\d+)[°º]\s*(\d+)[\'′]\s*(\d+(?:\.\d+)?)[\"″]?\s*([NSEW])'
-        ]
+        cleaned_str = coord_str.strip()
         
-        # Try each pattern
-        for pattern in patterns:
-            match = re.search(pattern, cleaned_str, re.IGNORECASE)
-            if match:
-                # Extract lat/long components
-                lat_deg = float(match.group(1))
-                lat_min = float(match.group(2)) / 60
-                lat_sec = float(match.group(3)) / 3600
-                lat_dir = match.group(4).upper()
-                
-                lon_deg = float(match.group(5))
-                lon_min = float(match.group(6)) / 60
-                lon_sec = float(match.group(7)) / 3600
-                lon_dir = match.group(8).upper()
-                
-                # Calculate decimal degrees
-                latitude = lat_deg + lat_min + lat_sec
-                if lat_dir == 'S':
-                    latitude = -latitude
-                    
-                longitude = lon_deg + lon_min + lon_sec
-                if lon_dir == 'W':
-                    longitude = -longitude
-                    
-                return latitude, longitude
+        # Without a degree sign there is nothing the pattern could match
+        if '°' not in cleaned_str and 'º' not in cleaned_str:
+            print(f"Could not parse coordinates: {coord_str}")
+            return None, None
         
-        # Special case for specific coordinates
-        if "33° 46' 36\" N, 118° 17' 0\" W" in cleaned_str:
-            return 33.77, -118.283333
-        
-        # Try simplified pattern without comma
-        simplified_pattern = r'(\d+)[°º](\d+)[\'′](\d+)[\"″]?([NS])\s+(\d+)[°º](\d+)[\'′](\d+)[\"″]?([EW])'
-        match = re.search(simplified_pattern, cleaned_str, re.IGNORECASE)
+        match = _COORD_RE.search(cleaned_str)
         if match:
-            lat_deg = float(match.group(1))
-            lat_min = float(match.group(2)) / 60
-            lat_sec = float(match.group(3)) / 3600
-            lat_dir = match.group(4).upper()
-            
-            lon_deg = float(match.group(5))
-            lon_min = float(match.group(6)) / 60
-            lon_sec = float(match.group(7)) / 3600
-            lon_dir = match.group(8).upper()
-            
-            latitude = lat_deg + lat_min + lat_sec
-            if lat_dir == 'S':
+            # Calculate decimal degrees
+            latitude = float(match.group('latd')) + float(match.group('latm')) / 60 + float(match.group('lats')) / 3600
+            if match.group('latdir').upper() == 'S':
                 latitude = -latitude
                 
-            longitude = lon_deg + lon_min + lon_sec
-            if lon_dir == 'W':
+            longitude = float(match.group('lond')) + float(match.group('lonm')) / 60 + float(match.group('lons')) / 3600
+            if match.group('londir').upper() == 'W':
                 longitude = -longitude
                 
             return latitude, longitude
+        
+        # Special case for specific coordinates
+        if "33° 46' 36\" N, 118° 17' 0\" W" in cleaned_str:
+            return 33.77, -118.283333
             
         print(f"Could not parse coordinates: {coord_str}")
         return None, None
@@ -81,6 +70,21 @@ def parse_coordinates(coord_str):
         print(f"Error processing coordinates: {coord_str} - {e}")
         return None, None
 
+def _dms_to_decimal(degrees, minutes, seconds, direction, negative_dir):
+    """Convert extracted DMS string columns to a float64 array of decimal degrees."""
+    value = (pd.to_numeric(degrees).to_numpy(dtype=np.float64, na_value=np.nan)
+             + pd.to_numeric(minutes).to_numpy(dtype=np.float64, na_value=np.nan) / 60
+             + pd.to_numeric(seconds).to_numpy(dtype=np.float64, na_value=np.nan) / 3600)
+    negative = direction.str.upper().eq(negative_dir).to_numpy(dtype=bool, na_value=False)
+    np.negative(value, out=value, where=negative)
+    return value
+
+def _text_column(df, col, default):
+    """Return df[col] as strings with missing values replaced by default, or default if there is no such column."""
+    if not col:
+        return default
+    return df[col].astype(object).fillna(default).astype(str)
+
 def process_data_file(file_path):
     """Process the data file (CSV or Excel) and extract producer data with coordinates."""
     # Determine file type by extension
@@ -89,19 +93,19 @@ def process_data_file(file_path):
     try:
         if file_extension == '.csv':
             print(f"Reading CSV file: {file_path}")
-            df = pd.read_csv(file_path, encoding='utf-8')
+            df = pd.read_csv(file_path, encoding='utf-8', engine=_CSV_ENGINE)
         elif file_extension in ['.xlsx', '.xls']:
             print(f"Reading Excel file: {file_path}")
             # Try different sheet names or the first sheet
             try:
-                df = pd.read_excel(file_path, sheet_name="North America Producers")
+                df = pd.read_excel(file_path, sheet_name="North America Producers", engine=_EXCEL_ENGINE)
                 print(f"Found sheet 'North America Producers'")
             except:
                 try:
-                    df = pd.read_excel(file_path, sheet_name="Sheet1")
+                    df = pd.read_excel(file_path, sheet_name="Sheet1", engine=_EXCEL_ENGINE)
                     print(f"Found sheet 'Sheet1'")
                 except:
-                    df = pd.read_excel(file_path)
+                    df = pd.read_excel(file_path, engine=_EXCEL_ENGINE)
                     print(f"Using first sheet as fallback")
         else:
             print(f"Unsupported file format: {file_extension}")
@@ -116,15 +120,16 @@ def process_data_file(file_path):
     print("Columns in file:", df.columns.tolist())
     
     # Look for key columns with different possible names
-    company_col = next((col for col in df.columns if col.lower() in ['owner', 'company', 'producer']), None)
-    coords_col = next((col for col in df.columns if col.lower() in ['coordinates', 'coords', 'location']), None)
-    planttype_col = next((col for col in df.columns if col.lower() in ['type of plant', 'plant type', 'planttype']), None)
-    address_col = next((col for col in df.columns if col.lower() in ['address', 'addr']), None)
-    city_col = next((col for col in df.columns if col.lower() in ['city', 'town']), None)
-    state_col = next((col for col in df.columns if col.lower() in ['state', 'province']), None)
-    country_col = next((col for col in df.columns if col.lower() in ['country', 'nation']), None)
-    gassource_col = next((col for col in df.columns if col.lower() in ['gas source', 'gas_source', 'source']), None)
-    capacity_col = next((col for col in df.columns if col.lower() in ['plant capacity', 'capacity']), None)
+    lowered = [(col.lower(), col) for col in df.columns]
+    company_col = next((col for low, col in lowered if low in ('owner', 'company', 'producer')), None)
+    coords_col = next((col for low, col in lowered if low in ('coordinates', 'coords', 'location')), None)
+    planttype_col = next((col for low, col in lowered if low in ('type of plant', 'plant type', 'planttype')), None)
+    address_col = next((col for low, col in lowered if low in ('address', 'addr')), None)
+    city_col = next((col for low, col in lowered if low in ('city', 'town')), None)
+    state_col = next((col for low, col in lowered if low in ('state', 'province')), None)
+    country_col = next((col for low, col in lowered if low in ('country', 'nation')), None)
+    gassource_col = next((col for low, col in lowered if low in ('gas source', 'gas_source', 'source')), None)
+    capacity_col = next((col for low, col in lowered if low in ('plant capacity', 'capacity')), None)
     
     if not company_col:
         print("Missing company column!")
@@ -136,519 +141,96 @@ def process_data_file(file_path):
     
     # Process coordinates
     print("Processing coordinates...")
-    latitudes = []
-    longitudes = []
+    coords = df[coords_col].astype('string')
     
-    for index, row in df.iterrows():
-        if coords_col and pd.notna(row[coords_col]):
-            lat, lon = parse_coordinates(row[coords_col])
-            latitudes.append(lat)
-            longitudes.append(lon)
-        else:
-            latitudes.append(None)
-            longitudes.append(None)
+    # Only run the regex on cells that contain a degree sign; blank and
+    # free-text cells cannot match and are left as NaN by the reindex
+    has_degrees = coords.str.contains('°|º', regex=True, na=False)
+    parts = coords[has_degrees].str.extract(_COORD_RE).reindex(df.index)
+
+    # Calculate decimal degrees for the whole column at once
+    latitude = pd.Series(_dms_to_decimal(parts['latd'], parts['latm'], parts['lats'], parts['latdir'], 'S'), index=df.index)
+    longitude = pd.Series(_dms_to_decimal(parts['lond'], parts['lonm'], parts['lons'], parts['londir'], 'W'), index=df.index)
+
+    # Hand the few strings the pattern could not match to parse_coordinates
+    # so special cases are still applied and failures are still reported
+    unmatched = df[coords_col].notna() & latitude.isna()
+    for index, coord_str in df.loc[unmatched, coords_col].items():
+        latitude[index], longitude[index] = parse_coordinates(coord_str)
+
+    df['latitude'] = latitude
+    df['longitude'] = longitude
+    valid_coords = int((latitude.notna() & longitude.notna()).sum())
     
-    df['latitude'] = latitudes
-    df['longitude'] = longitudes
+    # Producers without usable coordinates cannot be placed on the map
+    located = df[latitude.notna() & longitude.notna()]
     
-    # Create a clean dataset for mapping
-    mapping_data = []
+    # Create a clean dataset for mapping, one column per output field
+    slim = pd.DataFrame({
+        'company': _text_column(located, company_col, 'Unknown'),
+        'address': _text_column(located, address_col, 'Not available'),
+        'city': _text_column(located, city_col, 'Not available'),
+        'state': _text_column(located, state_col, 'Not available'),
+        'country': _text_column(located, country_col, 'Not available'),
+        'coordinates': _text_column(located, coords_col, 'Not available'),
+        'latitude': located['latitude'],
+        'longitude': located['longitude'],
+        'plantType': _text_column(located, planttype_col, 'Not specified'),
+        'gasSource': _text_column(located, gassource_col, 'Not specified'),
+        'capacity': _text_column(located, capacity_col, 'Not specified')
+    }, index=located.index)
     
-    for index, row in df.iterrows():
-        producer = {
-            'company': str(row.get(company_col, 'Unknown')) if pd.notna(row.get(company_col)) else 'Unknown',
-            'address': str(row.get(address_col, 'Not available')) if address_col and pd.notna(row.get(address_col)) else 'Not available',
-            'city': str(row.get(city_col, 'Not available')) if city_col and pd.notna(row.get(city_col)) else 'Not available',
-            'state': str(row.get(state_col, 'Not available')) if state_col and pd.notna(row.get(state_col)) else 'Not available',
-            'country': str(row.get(country_col, 'Not available')) if country_col and pd.notna(row.get(country_col)) else 'Not available',
-            'coordinates': str(row.get(coords_col, 'Not available')) if pd.notna(row.get(coords_col)) else 'Not available',
-            'latitude': row['latitude'],
-            'longitude': row['longitude'],
-            'plantType': str(row.get(planttype_col, 'Not specified')) if planttype_col and pd.notna(row.get(planttype_col)) else 'Not specified',
-            'gasSource': str(row.get(gassource_col, 'Not specified')) if gassource_col and pd.notna(row.get(gassource_col)) else 'Not specified',
-            'capacity': str(row.get(capacity_col, 'Not specified')) if capacity_col and pd.notna(row.get(capacity_col)) else 'Not specified'
-        }
-        mapping_data.append(producer)
+    mapping_data = slim.to_dict(orient='records')
     
-    valid_coords = sum(1 for item in mapping_data if item['latitude'] is not None and item['longitude'] is not None)
-    print(f"Found {valid_coords} valid coordinates out of {len(mapping_data)} records")
+    print(f"Found {valid_coords} valid coordinates out of {len(df)} records")
     
     return mapping_data
 
-def create_html_map(data, output_path="sulfuric_acid_map.html"):
-    """Create an HTML file with the interactive map using the processed data."""
-    html_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Sulfuric Acid Producers Map</title>
-    <!-- Load the required libraries in the correct order -->
-    <link rel="stylesheet" href="https://unpkg.com/leaflet@1.7.1/dist/leaflet.css" />
-    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.css" />
-    <link rel="stylesheet" href="https://unpkg.com/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css" />
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
-    
-    <script src="https://unpkg.com/leaflet@1.7.1/dist/leaflet.js"></script>
-    <script src="https://unpkg.com/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
-    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-    
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            font-family: Arial, sans-serif;
-        }
-        #header {
-            background-color: #2c3e50;
-            color: white;
-            padding: 15px;
-            text-align: center;
-        }
-        #container {
-            display: flex;
-            height: calc(100vh - 130px);
-        }
-        #sidebar {
-            width: 300px;
-            padding: 15px;
-            background-color: #f8f9fa;
-            overflow-y: auto;
-        }
-        #map {
-            flex-grow: 1;
-            height: 100%;
-        }
-        .filter-section {
-            margin-bottom: 15px;
-            border-bottom: 1px solid #ddd;
-            padding-bottom: 15px;
-        }
-        .filter-section h3 {
-            margin-top: 0;
-        }
-        .legend {
-            background-color: white;
-            padding: 10px;
-            border-radius: 5px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        .legend-item {
-            margin: 5px 0;
-        }
-        .marker-icon {
-            display: inline-block;
-            width: 15px;
-            height: 15px;
-            border-radius: 50%;
-            margin-right: 5px;
-        }
-        .marker-sulfur { background-color: #3388ff; }
-        .marker-metallurgical { background-color: #dc3545; }
-        .marker-regeneration { background-color: #28a745; }
-        .marker-other { background-color: #6c757d; }
-        .footer {
-            background-color: #f8f9fa;
-            text-align: center;
-            padding: 10px;
-            font-size: 12px;
-            color: #6c757d;
-        }
-        .stat-box {
-            background-color: #e9ecef;
-            border-radius: 5px;
-            padding: 10px;
-            margin-bottom: 10px;
-        }
-        .stat-box h4 {
-            margin: 0 0 5px 0;
-        }
-        .search-box {
-            margin-bottom: 15px;
-        }
-        #search-input {
-            width: 100%;
-            padding: 8px;
-            box-sizing: border-box;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }
-        .plant-list {
-            max-height: 300px;
-            overflow-y: auto;
-            margin-top: 10px;
-        }
-        .plant-item {
-            padding: 8px;
-            border-bottom: 1px solid #eee;
-            cursor: pointer;
-        }
-        .plant-item:hover {
-            background-color: #f0f0f0;
-        }
-        @media (max-width: 768px) {
-            #container {
-                flex-direction: column;
-                height: auto;
-            }
-            #sidebar {
-                width: 100%;
-                max-height: 300px;
-            }
-            #map {
-                height: 400px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div id="header">
-        <h1>Sulfuric Acid Producers Map</h1>
-        <p>Interactive map of sulfuric acid production facilities across North America</p>
-    </div>
-    
-    <div id="container">
-        <div id="sidebar">
-            <div class="search-box">
-                <input type="text" id="search-input" placeholder="Search by company or location...">
-            </div>
-            
-            <div class="filter-section">
-                <h3>Filters</h3>
-                <div>
-                    <input type="checkbox" id="filter-sulfur" checked>
-                    <label for="filter-sulfur">Sulfur Burner</label>
-                </div>
-                <div>
-                    <input type="checkbox" id="filter-metallurgical" checked>
-                    <label for="filter-metallurgical">Metallurgical</label>
-                </div>
-                <div>
-                    <input type="checkbox" id="filter-regeneration" checked>
-                    <label for="filter-regeneration">Acid Regeneration</label>
-                </div>
-                <div>
-                    <input type="checkbox" id="filter-other" checked>
-                    <label for="filter-other">Other Types</label>
-                </div>
-            </div>
-            
-            <div class="filter-section">
-                <h3>Country</h3>
-                <div>
-                    <input type="checkbox" id="country-usa" checked>
-                    <label for="country-usa">USA</label>
-                </div>
-                <div>
-                    <input type="checkbox" id="country-canada" checked>
-                    <label for="country-canada">Canada</label>
-                </div>
-                <div>
-                    <input type="checkbox" id="country-mexico" checked>
-                    <label for="country-mexico">Mexico</label>
-                </div>
-            </div>
-            
-            <div class="filter-section">
-                <h3>Statistics</h3>
-                <div class="stat-box">
-                    <h4>Plant Count by Type</h4>
-                    <div id="plant-type-stats"></div>
-                </div>
-                <div class="stat-box">
-                    <h4>Plant Count by Country</h4>
-                    <div id="country-stats"></div>
-                </div>
-            </div>
-            
-            <div class="filter-section">
-                <h3>Producer List</h3>
-                <div class="plant-list" id="plant-list"></div>
-            </div>
-        </div>
-        
-        <div id="map"></div>
-    </div>
-    
-    <div class="footer">
-        Created with Leaflet and MarkerCluster. Data extracted from Sulfuric Acid Producers data.
-    </div>
+# Fields with few distinct values, stored once in a lookup table in the page
+_CATEGORICAL_FIELDS = ('state', 'country', 'plantType', 'gasSource')
+
+def _encode_producer_data(data):
+    """Pack producer records into field names, lookup tables and value rows."""
+    fields = list(data[0]) if data else []
+    tables = {field: {} for field in _CATEGORICAL_FIELDS if field in fields}
     
-    <script>
-        // Producer data - loaded directly from data file
-        const producerData = PRODUCER_DATA_PLACEHOLDER;
-        
-        // Initialize the map when the page is fully loaded
-        document.addEventListener('DOMContentLoaded', function() {
-            // Initialize the map centered on North America
-            const map = L.map('map').setView([40, -100], 4);
-            
-            // Add the base tile layer (OpenStreetMap)
-            L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
-                attribution: '&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors',
-                maxZoom: 19
-            }).addTo(map);
-            
-            // Create a marker cluster group
-            const markers = L.markerClusterGroup();
-            
-            // Define marker icons for different plant types
-            const icons = {
-                'sulfur': L.divIcon({
-                    html: '<i class="fas fa-industry" style="color: #3388ff;"></i>',
-                    className: 'custom-div-icon',
-                    iconSize: [30, 30],
-                    iconAnchor: [15, 15]
-                }),
-                'metallurgical': L.divIcon({
-                    html: '<i class="fas fa-industry" style="color: #dc3545;"></i>',
-                    className: 'custom-div-icon',
-                    iconSize: [30, 30],
-                    iconAnchor: [15, 15]
-                }),
-                'regeneration': L.divIcon({
-                    html: '<i class="fas fa-industry" style="color: #28a745;"></i>',
-                    className: 'custom-div-icon',
-                    iconSize: [30, 30],
-                    iconAnchor: [15, 15]
-                }),
-                'other': L.divIcon({
-                    html: '<i class="fas fa-industry" style="color: #6c757d;"></i>',
-                    className: 'custom-div-icon',
-                    iconSize: [30, 30],
-                    iconAnchor: [15, 15]
-                })
-            };
-            
-            // Create marker and add to the cluster group
-            function createMarker(producer) {
-                try {
-                    if (!producer.latitude || !producer.longitude || isNaN(producer.latitude) || isNaN(producer.longitude)) return null;
-                    
-                    const plantType = producer.plantType.toLowerCase();
-                    let iconType = 'other';
-                    
-                    if (plantType.includes('sulfur')) {
-                        iconType = 'sulfur';
-                    } else if (plantType.includes('metallurgical')) {
-                        iconType = 'metallurgical';
-                    } else if (plantType.includes('regeneration') || plantType.includes('regenerat')) {
-                        iconType = 'regeneration';
-                    }
-                    
-                    const popupContent = `
-                        <div style="min-width: 200px; max-width: 300px;">
-                            <h3>${producer.company}</h3>
-                            <p><b>Location:</b> ${producer.city}, ${producer.state}</p>
-                            <p><b>Country:</b> ${producer.country}</p>
-                            <p><b>Plant Type:</b> ${producer.plantType}</p>
-                            <p><b>Gas Source:</b> ${producer.gasSource}</p>
-                            <p><b>Capacity:</b> ${producer.capacity}</p>
-                        </div>
-                    `;
-                    
-                    const marker = L.marker([producer.latitude, producer.longitude], {
-                        icon: icons[iconType],
-                        alt: producer.company,
-                        plantType: iconType,
-                        country: producer.country.toLowerCase()
-                    }).bindPopup(popupContent);
-                    
-                    return marker;
-                } catch (e) {
-                    console.error("Error creating marker:", e, producer);
-                    return null;
-                }
-            }
-            
-            // Add all markers to the map
-            function addAllMarkers() {
-                try {
-                    // Clear existing markers
-                    markers.clearLayers();
-                    
-                    // Stats counters
-                    const stats = {
-                        types: {
-                            sulfur: 0,
-                            metallurgical: 0,
-                            regeneration: 0,
-                            other: 0
-                        },
-                        countries: {
-                            usa: 0,
-                            canada: 0,
-                            mexico: 0,
-                            other: 0
-                        }
-                    };
-                    
-                    // Filter the data based on selections
-                    const filteredData = producerData.filter(producer => {
-                        try {
-                            // Check if we have valid coordinates
-                            if (!producer.latitude || !producer.longitude || isNaN(producer.latitude) || isNaN(producer.longitude)) return false;
-                            
-                            // Check plant type filters
-                            const plantType = (producer.plantType || "").toLowerCase();
-                            let typeMatch = false;
-                            let typeCategory = 'other';
-                            
-                            if (plantType.includes('sulfur')) {
-                                typeMatch = document.getElementById('filter-sulfur').checked;
-                                typeCategory = 'sulfur';
-                            } else if (plantType.includes('metallurgical')) {
-                                typeMatch = document.getElementById('filter-metallurgical').checked;
-                                typeCategory = 'metallurgical';
-                            } else if (plantType.includes('regeneration') || plantType.includes('regenerat')) {
-                                typeMatch = document.getElementById('filter-regeneration').checked;
-                                typeCategory = 'regeneration';
-                            } else {
-                                typeMatch = document.getElementById('filter-other').checked;
-                            }
-                            
-                            // Check country filters
-                            const country = (producer.country || "").toLowerCase();
-                            let countryMatch = false;
-                            let countryCategory = 'other';
-                            
-                            if (country.includes('usa') || country.includes('united states')) {
-                                countryMatch = document.getElementById('country-usa').checked;
-                                countryCategory = 'usa';
-                            } else if (country.includes('canada')) {
-                                countryMatch = document.getElementById('country-canada').checked;
-                                countryCategory = 'canada';
-                            } else if (country.includes('mexico')) {
-                                countryMatch = document.getElementById('country-mexico').checked;
-                                countryCategory = 'mexico';
-                            } else {
-                                countryMatch = true; // Keep other countries visible by default
-                            }
-                            
-                            // Check search filter
-                            const searchText = document.getElementById('search-input').value.toLowerCase();
-                            const searchMatch = searchText === '' || 
-                                            (producer.company || "").toLowerCase().includes(searchText) ||
-                                            (producer.city || "").toLowerCase().includes(searchText) ||
-                                            (producer.state || "").toLowerCase().includes(searchText) ||
-                                            (producer.country || "").toLowerCase().includes(searchText);
-                            
-                            // Update statistics if item passes all filters
-                            if (typeMatch && countryMatch && searchMatch) {
-                                stats.types[typeCategory]++;
-                                stats.countries[countryCategory]++;
-                            }
-                            
-                            return typeMatch && countryMatch && searchMatch;
-                        } catch (e) {
-                            console.error("Error filtering producer:", e, producer);
-                            return false;
-                        }
-                    });
-                    
-                    console.log(`Adding ${filteredData.length} markers to the map`);
-                    
-                    // Create and add markers for filtered data
-                    filteredData.forEach(producer => {
-                        const marker = createMarker(producer);
-                        if (marker) markers.addLayer(marker);
-                    });
-                    
-                    map.addLayer(markers);
-                    
-                    // Update the statistics display
-                    updateStats(stats);
-                    
-                    // Update the plant list
-                    updatePlantList(filteredData);
-                } catch (e) {
-                    console.error("Error in addAllMarkers:", e);
-                }
-            }
-            
-            // Update statistics displays
-            function updateStats(stats) {
-                document.getElementById('plant-type-stats').innerHTML = `
-                    <div>Sulfur Burner: ${stats.types.sulfur}</div>
-                    <div>Metallurgical: ${stats.types.metallurgical}</div>
-                    <div>Acid Regeneration: ${stats.types.regeneration}</div>
-                    <div>Other: ${stats.types.other}</div>
-                    <div><b>Total: ${stats.types.sulfur + stats.types.metallurgical + stats.types.regeneration + stats.types.other}</b></div>
-                `;
-                
-                document.getElementById('country-stats').innerHTML = `
-                    <div>USA: ${stats.countries.usa}</div>
-                    <div>Canada: ${stats.countries.canada}</div>
-                    <div>Mexico: ${stats.countries.mexico}</div>
-                    <div>Other: ${stats.countries.other}</div>
-                `;
-            }
-            
-            // Update the plant list in sidebar
-            function updatePlantList(filteredData) {
-                const plantList = document.getElementById('plant-list');
-                plantList.innerHTML = '';
-                
-                filteredData.forEach(producer => {
-                    const item = document.createElement('div');
-                    item.className = 'plant-item';
-                    item.innerHTML = `<b>${producer.company}</b><br>${producer.city}, ${producer.state}`;
-                    
-                    item.addEventListener('click', () => {
-                        if (producer.latitude && producer.longitude) {
-                            map.setView([producer.latitude, producer.longitude], 10);
-                            
-                            // Find and open the marker's popup
-                            markers.eachLayer(marker => {
-                                const latlng = marker.getLatLng();
-                                if (latlng.lat === producer.latitude && latlng.lng === producer.longitude) {
-                                    marker.openPopup();
-                                }
-                            });
-                        }
-                    });
-                    
-                    plantList.appendChild(item);
-                });
-            }
-            
-            // Add legend to the map
-            const legend = L.control({ position: 'bottomright' });
-            legend.onAdd = function (map) {
-                const div = L.DomUtil.create('div', 'legend');
-                div.innerHTML = `
-                    <h4>Plant Types</h4>
-                    <div class="legend-item"><span class="marker-icon marker-sulfur"></span> Sulfur Burner</div>
-                    <div class="legend-item"><span class="marker-icon marker-metallurgical"></span> Metallurgical</div>
-                    <div class="legend-item"><span class="marker-icon marker-regeneration"></span> Acid Regeneration</div>
-                    <div class="legend-item"><span class="marker-icon marker-other"></span> Other</div>
-                `;
-                return div;
-            };
-            legend.addTo(map);
-            
-            // Add event listeners for filters
-            document.querySelectorAll('input[type="checkbox"]').forEach(checkbox => {
-                checkbox.addEventListener('change', addAllMarkers);
-            });
-            
-            document.getElementById('search-input').addEventListener('input', addAllMarkers);
-            
-            // Initialize with all markers
-            addAllMarkers();
-        });
-    </script>
-</body>
-</html>
-    """
+    # Resolve each field's lookup table once rather than once per producer
+    columns = [(field, tables.get(field)) for field in fields]
+    rows = [
+        [producer[field] if table is None else table.setdefault(producer[field], len(table))
+         for field, table in columns]
+        for producer in data
+    ]
     
-    # Insert the data into the template
-    data_json = json.dumps(data, indent=2)
-    html_content = html_template.replace("PRODUCER_DATA_PLACEHOLDER", data_json)
+    return {
+        'fields': fields,
+        'dict': {field: list(table) for field, table in tables.items()},
+        'rows': rows
+    }
+
+def _dumps_json(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _load_template():
+    """Read the page template next to this module as UTF-8 bytes, split at the data placeholder."""
+    template = (pathlib.Path(__file__).parent / "sulfuric_acid_map_template.html").read_bytes()
+    return template.split(b"PRODUCER_DATA_PLACEHOLDER", 1)
+
+def create_html_map(data, output_path="sulfuric_acid_map.html"):
+    """Create an HTML file with the interactive map using the processed data."""
+    # Gzip the data and embed it as base64; the page decompresses it on load
+    payload = gzip.compress(_dumps_json(_encode_producer_data(data)))
+    prefix, suffix = _load_template()
     
     # Save the HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    with open(output_path, 'wb') as f:
+        f.write(prefix)
+        f.write(base64.b64encode(payload))
+        f.write(suffix)
     
     print(f"Map saved to: {output_path}")
     return output_path
@@ -658,19 +240,23 @@ def main(file_path, output_html="sulfuric_acid_map.html"):
     print(f"Processing file: {file_path}")
     data = process_data_file(file_path)
     
-    if data:
-        html_path = create_html_map(data, output_html)
-        print(f"Map created successfully: {html_path}")
-        
-        # Open the map in the default browser
-        if os.path.exists(html_path):
-            print(f"Opening map in browser...")
-            webbrowser.open('file://' + os.path.abspath(html_path))
-        
-        return True
-    else:
+    if data is None:
         print("Failed to process data file.")
         return False
+    
+    if not data:
+        print("No producers with valid coordinates found; no map was created.")
+        return False
+    
+    html_path = create_html_map(data, output_html)
+    print(f"Map created successfully: {html_path}")
+    
+    # Open the map in the default browser
+    if os.path.exists(html_path):
+        print(f"Opening map in browser...")
+        webbrowser.open('file://' + os.path.abspath(html_path))
+    
+    return True
 
 if __name__ == "__main__":
     import argparse